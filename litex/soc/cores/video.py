@@ -162,7 +162,7 @@ video_data_layout = [
 ]
 
 class VideoTimingGenerator(Module, AutoCSR):
-    def __init__(self, default_video_timings="800x600@60Hz"):
+    def __init__(self, default_video_timings="800x600@60Hz", clock_domain="sys"):
         # Check / Get Video Timings (can be str or dict)
         if isinstance(default_video_timings, str):
             try:
@@ -195,33 +195,34 @@ class VideoTimingGenerator(Module, AutoCSR):
 
         # Resynchronize Enable to Video clock domain.
         self.enable = enable = Signal()
-        self.specials += MultiReg(self._enable.storage, enable)
+        self.specials += MultiReg(self._enable.storage, enable, odomain=clock_domain)
 
         # Resynchronize Horizontal Timings to Video clock domain.
         self.hres        = hres        = Signal(hbits)
         self.hsync_start = hsync_start = Signal(hbits)
         self.hsync_end   = hsync_end   = Signal(hbits)
         self.hscan       = hscan       = Signal(hbits)
-        self.specials += MultiReg(self._hres.storage,        hres)
-        self.specials += MultiReg(self._hsync_start.storage, hsync_start)
-        self.specials += MultiReg(self._hsync_end.storage,   hsync_end)
-        self.specials += MultiReg(self._hscan.storage,       hscan)
+        self.specials += MultiReg(self._hres.storage,        hres,        odomain=clock_domain)
+        self.specials += MultiReg(self._hsync_start.storage, hsync_start, odomain=clock_domain)
+        self.specials += MultiReg(self._hsync_end.storage,   hsync_end,   odomain=clock_domain)
+        self.specials += MultiReg(self._hscan.storage,       hscan,       odomain=clock_domain)
 
         # Resynchronize Vertical Timings to Video clock domain.
         self.vres        = vres        = Signal(vbits)
         self.vsync_start = vsync_start = Signal(vbits)
         self.vsync_end   = vsync_end   = Signal(vbits)
         self.vscan       = vscan       = Signal(vbits)
-        self.specials += MultiReg(self._vres.storage,        vres)
-        self.specials += MultiReg(self._vsync_start.storage, vsync_start)
-        self.specials += MultiReg(self._vsync_end.storage,   vsync_end)
-        self.specials += MultiReg(self._vscan.storage,       vscan)
+        self.specials += MultiReg(self._vres.storage,        vres,        odomain=clock_domain)
+        self.specials += MultiReg(self._vsync_start.storage, vsync_start, odomain=clock_domain)
+        self.specials += MultiReg(self._vsync_end.storage,   vsync_end,   odomain=clock_domain)
+        self.specials += MultiReg(self._vscan.storage,       vscan,       odomain=clock_domain)
 
         # Generate timings.
         hactive = Signal()
         vactive = Signal()
         fsm = FSM(reset_state="IDLE")
         fsm = ResetInserter()(fsm)
+        fsm = ClockDomainsRenamer(clock_domain)(fsm)
         self.submodules.fsm = fsm
         self.comb += fsm.reset.eq(~enable)
         fsm.act("IDLE",
@@ -234,8 +235,9 @@ class VideoTimingGenerator(Module, AutoCSR):
             NextState("RUN")
         )
         self.comb += source.de.eq(hactive & vactive) # DE when both HActive and VActive.
-        self.sync += source.first.eq((source.hcount ==     0) & (source.vcount ==     0)),
-        self.sync += source.last.eq( (source.hcount == hscan) & (source.vcount == vscan)),
+        sync = getattr(self.sync, clock_domain)
+        sync += source.first.eq((source.hcount ==     0) & (source.vcount ==     0)),
+        sync += source.last.eq( (source.hcount == hscan) & (source.vcount == vscan)),
         fsm.act("RUN",
             source.valid.eq(1),
             If(source.ready,
@@ -8,12 +8,19 @@
 
 import logging
 import time
+import types
 import datetime
-from math import log2, ceil
+import functools
 
 from migen import *
 
 from litex.soc.cores import cpu
+from litex.soc.cores import uart
+from litex.soc.cores.timer import Timer
+from litex.soc.cores.identifier import Identifier
+from litex.soc.cores.jtag import JTAGAtlantic, JTAGPHY
+from litex.soc.cores.spi import SPIMaster
+from litex.soc.cores.video import VideoTimingGenerator, ColorBarsPattern, VideoTerminal, VideoFrameBuffer
 
 from litex.soc.interconnect.csr import *
 from litex.soc.interconnect.csr_eventmanager import *
@@ -40,6 +47,21 @@ def colorer(s, color="bright"):
     trailer = "\x1b[0m"
     return header + str(s) + trailer
 
+def _prev_pow2(x):
+    return 1 << (int(x).bit_length() - 1)
+
+@functools.lru_cache(maxsize=32)
+def _parse_video_resolution(timings):
+    resolution, _, _ = timings.partition("@")
+    hres, _, vres    = resolution.partition("x")
+    return int(hres), int(vres)
+
+def _video_resolution(timings):
+    # Timings are either a "HRESxVRES@..." string or a (name, timings) tuple.
+    if not isinstance(timings, str):
+        timings = timings[0]
+    return _parse_video_resolution(timings)
+
 def build_time(with_time=True):
     fmt = "%Y-%m-%d %H:%M:%S" if with_time else "%Y-%m-%d"
     return datetime.datetime.fromtimestamp(time.time()).strftime(fmt)
@@ -51,21 +73,41 @@ def SoCConstant(value):
 
 # SoCRegion ----------------------------------------------------------------------------------------
 
+_soc_region_logger = logging.getLogger("SoCRegion")
+
+def _decode_true(a):
+    return True
+
+def _decode_match(log2size, origin, a):
+    return (a[log2size:] == origin)
+
 class SoCRegion:
+    # length/type are set by SoCCore for retro-compatibility.
+    __slots__ = ("logger", "origin", "size", "size_pow2", "mode", "cached", "linker", "read_only",
+        "length", "type")
+
+    reserved_size = 0x1000000
+
     def __init__(self, origin=None, size=None, mode="rw", cached=True, linker=False):
-        self.logger    = logging.getLogger("SoCRegion")
+        self.logger    = _soc_region_logger
         self.origin    = origin
         self.size      = size
-        if size != 2**log2_int(size, False):
+        is_pow2        = (size != 0) and ((size & (size - 1)) == 0)
+        self.size_pow2 = size if is_pow2 else (1 << size.bit_length())
+        if not is_pow2 and self.logger.isEnabledFor(logging.INFO):
             self.logger.info("Region size {} internally from {} to {}.".format(
                 colorer("rounded", color="cyan"),
                 colorer("0x{:08x}".format(size)),
-                colorer("0x{:08x}".format(2**log2_int(size, False)))))
-        self.size_pow2 = 2**log2_int(size, False)
+                colorer("0x{:08x}".format(self.size_pow2))))
         self.mode      = mode
+        self.read_only = (mode == "r")
         self.cached    = cached
         self.linker    = linker
 
+    @classmethod
+    def reserved(cls, origin):
+        return cls(origin=origin, size=cls.reserved_size)
+
     def decoder(self, bus):
         origin = self.origin
         size   = self.size_pow2
@@ -74,10 +116,13 @@ class SoCRegion:
             self.logger.error(self)
             raise
         if (origin == 0) and (size == 2**bus.address_width):
-            return lambda a : True
-        origin >>= int(log2(bus.data_width//8)) # bytes to words aligned.
-        size   >>= int(log2(bus.data_width//8)) # bytes to words aligned.
-        return lambda a: (a[log2_int(size):] == (origin >> log2_int(size)))
+            return _decode_true
+        shift    = (bus.data_width//8).bit_length() - 1
+        origin >>= shift # bytes to words aligned.
+        size   >>= shift # bytes to words aligned.
+        log2size = size.bit_length() - 1
+        origin >>= log2size
+        return functools.partial(_decode_match, log2size, origin)
 
     def __str__(self):
         r = ""
@@ -90,11 +135,14 @@ class SoCRegion:
         r += "Linker: {}".format(colorer(self.linker))
         return r
 
-class SoCIORegion(SoCRegion): pass
+class SoCIORegion(SoCRegion):
+    __slots__ = ()
 
 # SoCCSRRegion -------------------------------------------------------------------------------------
 
 class SoCCSRRegion:
+    __slots__ = ("origin", "busword", "obj")
+
     def __init__(self, origin, busword, obj):
         self.origin  = origin
         self.busword = busword
@@ -102,6 +150,46 @@ class SoCCSRRegion:
 
 # SoCBusHandler ------------------------------------------------------------------------------------
 
+_MAIN_BUS_CLS = {
+    "wishbone": wishbone.Interface,
+    "axi-lite": axi.AXILiteInterface,
+}
+
+_DATA_WIDTH_CONVERTERS = {
+    wishbone.Interface:   wishbone.Converter,
+    axi.AXILiteInterface: axi.AXILiteConverter,
+}
+
+_BUS_BRIDGES = {
+    (wishbone.Interface, axi.AXILiteInterface): axi.Wishbone2AXILite,
+    (axi.AXILiteInterface, wishbone.Interface): axi.AXILite2Wishbone,
+}
+
+_BUS_NAMES = {
+    wishbone.Interface:   "Wishbone",
+    axi.AXILiteInterface: "AXI Lite",
+}
+
+_INTERCONNECT_P2P_CLS = {
+    "wishbone": wishbone.InterconnectPointToPoint,
+    "axi-lite": axi.AXILiteInterconnectPointToPoint,
+}
+
+_INTERCONNECT_SHARED_CLS = {
+    "wishbone": wishbone.InterconnectShared,
+    "axi-lite": axi.AXILiteInterconnectShared,
+}
+
+_RAM_CLS = {
+    "wishbone": wishbone.SRAM,
+    "axi-lite": axi.AXILiteSRAM,
+}
+
+_CSR_BRIDGE_CLS = {
+    "wishbone": wishbone.Wishbone2CSR,
+    "axi-lite": axi.AXILite2CSR,
+}
+
 class SoCBusHandler(Module):
     supported_standard      = ["wishbone", "axi-lite"]
     supported_data_width    = [32, 64]
@@ -145,14 +233,15 @@ class SoCBusHandler(Module):
         self.regions       = {}
         self.io_regions    = {}
         self.timeout       = timeout
-        self.logger.info("{}-bit {} Bus, {}GiB Address Space.".format(
-            colorer(data_width), colorer(standard), colorer(2**address_width/2**30)))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("{}-bit {} Bus, {}GiB Address Space.".format(
+                colorer(data_width), colorer(standard), colorer(2**address_width/2**30)))
 
         # Add reserved regions.
         self.logger.info("Adding {} Bus Regions...".format(colorer("reserved", color="cyan")))
         for name, region in reserved_regions.items():
             if isinstance(region, int):
-                region = SoCRegion(origin=region, size=0x1000000)
+                region = SoCRegion.reserved(origin=region)
             self.add_region(name, region)
 
         self.logger.info("Bus Handler {}.".format(colorer("created", color="green")))
@@ -160,7 +249,7 @@ class SoCBusHandler(Module):
     # Add/Allog/Check Regions ----------------------------------------------------------------------
     def add_region(self, name, region):
         allocated = False
-        if name in self.regions.keys() or name in self.io_regions.keys():
+        if name in self.regions or name in self.io_regions:
             self.logger.error("{} already declared as Region:".format(colorer(name, color="red")))
             self.logger.error(self)
             raise
@@ -168,7 +257,7 @@ class SoCBusHandler(Module):
         if isinstance(region, SoCIORegion):
             self.io_regions[name] = region
             # Check for overlap with others IO regions.
-            overlap = self.check_regions_overlap(self.io_regions)
+            overlap = self._check_overlap_with_new(name, self.io_regions)
             if overlap is not None:
                 self.logger.error("IO Region {} between {} and {}:".format(
                     colorer("overlap", color="red"),
@@ -177,10 +266,11 @@ class SoCBusHandler(Module):
                 self.logger.error(str(self.io_regions[overlap[0]]))
                 self.logger.error(str(self.io_regions[overlap[1]]))
                 raise
-            self.logger.info("{} Region {} at {}.".format(
-                colorer(name,    color="underline"),
-                colorer("added", color="green"),
-                str(region)))
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("{} Region {} at {}.".format(
+                    colorer(name,    color="underline"),
+                    colorer("added", color="green"),
+                    str(region)))
         # Check if is SoCRegion
         elif isinstance(region, SoCRegion):
             # If no Origin specified, allocate Region.
@@ -201,7 +291,7 @@ class SoCBusHandler(Module):
                         raise
                 self.regions[name] = region
                 # Check for overlab with others IO regions.
-                overlap = self.check_regions_overlap(self.regions)
+                overlap = self._check_overlap_with_new(name, self.regions)
                 if overlap is not None:
                     self.logger.error("Region {} between {} and {}:".format(
                         colorer("overlap", color="red"),
@@ -210,18 +300,21 @@ class SoCBusHandler(Module):
                     self.logger.error(str(self.regions[overlap[0]]))
                     self.logger.error(str(self.regions[overlap[1]]))
                     raise
-            self.logger.info("{} Region {} at {}.".format(
-                colorer(name, color="underline"),
-                colorer("allocated" if allocated else "added", color="cyan" if allocated else "green"),
-                str(region)))
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("{} Region {} at {}.".format(
+                    colorer(name, color="underline"),
+                    colorer("allocated" if allocated else "added", color="cyan" if allocated else "green"),
+                    str(region)))
         else:
             self.logger.error("{} is not a supported Region.".format(colorer(name, color="red")))
             raise
+        return region
 
     def alloc_region(self, name, size, cached=True):
-        self.logger.info("Allocating {} Region of size {}...".format(
-            colorer("Cached" if cached else "IO"),
-            colorer("0x{:08x}".format(size))))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Allocating {} Region of size {}...".format(
+                colorer("Cached" if cached else "IO"),
+                colorer("0x{:08x}".format(size))))
 
         # Limit Search Regions.
         if cached == False:
@@ -229,26 +322,40 @@ class SoCBusHandler(Module):
         else:
             search_regions = {"main": SoCRegion(origin=0x00000000, size=2**self.address_width-1)}
 
+        # Walk the gaps between allocated existing regions (sorted and non-overlapping).
+        size_pow2 = 2**log2_int(size, False)
+        allocated = self._sorted_intervals(self.regions)
+
         # Iterate on Search_Regions to find a Candidate.
-        for _, search_region in search_regions.items():
-            origin = search_region.origin
-            while (origin + size) < (search_region.origin + search_region.size_pow2):
-                # Create a Candidate.
-                candidate = SoCRegion(origin=origin, size=size, cached=cached)
-                overlap   = False
-                # Check Candidate does not overlap with allocated existing regions.
-                for _, allocated in self.regions.items():
-                    if self.check_regions_overlap({"0": allocated, "1": candidate}) is not None:
-                        origin  = allocated.origin + allocated.size_pow2
-                        overlap = True
-                        break
-                if not overlap:
-                    # If no overlap, the Candidate is selected.
-                    return candidate
+        for search_region in search_regions.values():
+            search_end = search_region.origin + search_region.size_pow2
+            origin     = search_region.origin
+            for allocated_origin, allocated_end, _ in allocated:
+                if allocated_end <= origin:
+                    continue
+                # Align Candidate on its size.
+                origin = (origin + size_pow2 - 1) & ~(size_pow2 - 1)
+                if (origin + size) > search_end:
+                    break
+                # If Candidate fits in the gap before this allocated region, the Candidate is selected.
+                if (origin + size_pow2) <= allocated_origin:
+                    return SoCRegion(origin=origin, size=size, cached=cached)
+                origin = max(origin, allocated_end)
+            else:
+                # Last gap, after all allocated regions.
+                origin = (origin + size_pow2 - 1) & ~(size_pow2 - 1)
+                if (origin + size) <= search_end:
+                    return SoCRegion(origin=origin, size=size, cached=cached)
 
         self.logger.error("Not enough Address Space to allocate Region.")
         raise
 
+    def _sorted_intervals(self, regions):
+        # Linker regions are not allocated space, skip them.
+        intervals = [(r.origin, r.origin + r.size_pow2, n) for n, r in regions.items() if not r.linker]
+        intervals.sort(key=lambda interval: interval[0])
+        return intervals
+
     def check_regions_overlap(self, regions, check_linker=False):
         i = 0
         while i < len(regions):
@@ -267,32 +374,42 @@ class SoCBusHandler(Module):
             i += 1
         return None
 
+    def _check_overlap_with_new(self, name, regions, check_linker=False):
+        # Existing regions are already checked against each other, only check the new one.
+        r0 = regions[name]
+        if r0.linker and not check_linker:
+            return None
+        for n1, r1 in regions.items():
+            if (n1 == name) or (r1.linker and not check_linker):
+                continue
+            if r0.origin >= (r1.origin + r1.size_pow2):
+                continue
+            if r1.origin >= (r0.origin + r0.size_pow2):
+                continue
+            return (n1, name)
+        return None
+
     def check_region_is_in(self, region, container):
-        is_in = True
-        if not (region.origin >= container.origin):
-            is_in = False
-        if not ((region.origin + region.size) < (container.origin + container.size)):
-            is_in = False
-        return is_in
+        origin = region.origin
+        return ((origin >= container.origin) and
+                ((origin + region.size) <= (container.origin + container.size)))
 
     def check_region_is_io(self, region):
-        is_io = False
-        for _, io_region in self.io_regions.items():
-            if self.check_region_is_in(region, io_region):
-                is_io = True
-        return is_io
+        return any(self.check_region_is_in(region, io_region) for io_region in self.io_regions.values())
 
     # Add Master/Slave -----------------------------------------------------------------------------
     def add_adapter(self, name, interface, direction="m2s"):
         assert direction in ["m2s", "s2m"]
+        main_bus_cls = _MAIN_BUS_CLS[self.standard]
+
+        # Interface already matching Main Bus: nothing to adapt.
+        if isinstance(interface, main_bus_cls) and (interface.data_width == self.data_width):
+            return interface
 
         # Data width conversion.
         if interface.data_width != self.data_width:
             interface_cls = type(interface)
-            converter_cls = {
-                wishbone.Interface:   wishbone.Converter,
-                axi.AXILiteInterface: axi.AXILiteConverter,
-            }[interface_cls]
+            converter_cls = _DATA_WIDTH_CONVERTERS[interface_cls]
             converted_interface = interface_cls(data_width=self.data_width)
             if direction == "m2s":
                 master, slave = interface, converted_interface
@@ -304,10 +421,6 @@ class SoCBusHandler(Module):
             converted_interface = interface
 
         # Wishbone <-> AXILite bridging.
-        main_bus_cls = {
-            "wishbone": wishbone.Interface,
-            "axi-lite": axi.AXILiteInterface,
-        }[self.standard]
         if isinstance(converted_interface, main_bus_cls):
             bridged_interface = converted_interface
         else:
@@ -316,32 +429,26 @@ class SoCBusHandler(Module):
                 master, slave = converted_interface, bridged_interface
             elif direction == "s2m":
                 master, slave = bridged_interface, converted_interface
-            bridge_cls = {
-                (wishbone.Interface, axi.AXILiteInterface): axi.Wishbone2AXILite,
-                (axi.AXILiteInterface, wishbone.Interface): axi.AXILite2Wishbone,
-            }[type(master), type(slave)]
+            bridge_cls = _BUS_BRIDGES[type(master), type(slave)]
             bridge = bridge_cls(master, slave)
             self.submodules += bridge
 
-        if type(interface) != type(bridged_interface) or interface.data_width != bridged_interface.data_width:
+        adapted = type(interface) != type(bridged_interface) or interface.data_width != bridged_interface.data_width
+        if adapted and self.logger.isEnabledFor(logging.INFO):
             fmt = "{name} Bus {converted} from {from_bus} {from_bits}-bit to {to_bus} {to_bits}-bit."
-            bus_names = {
-                wishbone.Interface:   "Wishbone",
-                axi.AXILiteInterface: "AXI Lite",
-            }
             self.logger.info(fmt.format(
                 name      = colorer(name),
                 converted = colorer("converted", color="cyan"),
-                from_bus  = colorer(bus_names[type(interface)]),
+                from_bus  = colorer(_BUS_NAMES[type(interface)]),
                 from_bits = colorer(interface.data_width),
-                to_bus    = colorer(bus_names[type(bridged_interface)]),
+                to_bus    = colorer(_BUS_NAMES[type(bridged_interface)]),
                 to_bits   = colorer(bridged_interface.data_width)))
         return bridged_interface
 
     def add_master(self, name=None, master=None):
         if name is None:
             name = "master{:d}".format(len(self.masters))
-        if name in self.masters.keys():
+        if name in self.masters:
             self.logger.error("{} {} as Bus Master:".format(
                 colorer(name),
                 colorer("already declared", color="red")))
@@ -349,9 +456,10 @@ class SoCBusHandler(Module):
             raise
         master = self.add_adapter(name, master, "m2s")
         self.masters[name] = master
-        self.logger.info("{} {} as Bus Master.".format(
-            colorer(name,    color="underline"),
-            colorer("added", color="green")))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("{} {} as Bus Master.".format(
+                colorer(name,    color="underline"),
+                colorer("added", color="green")))
 
     def add_slave(self, name=None, slave=None, region=None):
         no_name   = name is None
@@ -373,7 +481,7 @@ class SoCBusHandler(Module):
                 raise
         else:
              self.add_region(name, region)
-        if name in self.slaves.keys():
+        if name in self.slaves:
             self.logger.error("{} {} as Bus Slave:".format(
                 colorer(name),
                 colorer("already declared", color="red")))
@@ -381,30 +489,32 @@ class SoCBusHandler(Module):
             raise
         slave = self.add_adapter(name, slave, "s2m")
         self.slaves[name] = slave
-        self.logger.info("{} {} as Bus Slave.".format(
-            colorer(name, color="underline"),
-            colorer("added", color="green")))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("{} {} as Bus Slave.".format(
+                colorer(name, color="underline"),
+                colorer("added", color="green")))
 
     # Str ------------------------------------------------------------------------------------------
     def __str__(self):
-        r = "{}-bit {} Bus, {}GiB Address Space.\n".format(
-            colorer(self.data_width), colorer(self.standard), colorer(2**self.address_width/2**30))
-        r += "IO Regions: ({})\n".format(len(self.io_regions.keys())) if len(self.io_regions.keys()) else ""
-        io_regions = {k: v for k, v in sorted(self.io_regions.items(), key=lambda item: item[1].origin)}
-        for name, region in io_regions.items():
-           r += colorer(name, color="underline") + " "*(20-len(name)) + ": " + str(region) + "\n"
-        r += "Bus Regions: ({})\n".format(len(self.regions.keys())) if len(self.regions.keys()) else ""
-        regions = {k: v for k, v in sorted(self.regions.items(), key=lambda item: item[1].origin)}
-        for name, region in regions.items():
-           r += colorer(name, color="underline") + " "*(20-len(name)) + ": " + str(region) + "\n"
-        r += "Bus Masters: ({})\n".format(len(self.masters.keys())) if len(self.masters.keys()) else ""
-        for name in self.masters.keys():
-           r += "- {}\n".format(colorer(name, color="underline"))
-        r += "Bus Slaves: ({})\n".format(len(self.slaves.keys())) if len(self.slaves.keys()) else ""
-        for name in self.slaves.keys():
-           r += "- {}\n".format(colorer(name, color="underline"))
-        r = r[:-1]
-        return r
+        r = ["{}-bit {} Bus, {}GiB Address Space.\n".format(
+            colorer(self.data_width), colorer(self.standard), colorer(2**self.address_width/2**30))]
+        if self.io_regions:
+            r.append("IO Regions: ({})\n".format(len(self.io_regions)))
+        for name, region in sorted(self.io_regions.items(), key=lambda item: item[1].origin):
+           r.append(colorer(name, color="underline") + " "*(20-len(name)) + ": " + str(region) + "\n")
+        if self.regions:
+            r.append("Bus Regions: ({})\n".format(len(self.regions)))
+        for name, region in sorted(self.regions.items(), key=lambda item: item[1].origin):
+           r.append(colorer(name, color="underline") + " "*(20-len(name)) + ": " + str(region) + "\n")
+        if self.masters:
+            r.append("Bus Masters: ({})\n".format(len(self.masters)))
+        for name in self.masters:
+           r.append("- {}\n".format(colorer(name, color="underline")))
+        if self.slaves:
+            r.append("Bus Slaves: ({})\n".format(len(self.slaves)))
+        for name in self.slaves:
+           r.append("- {}\n".format(colorer(name, color="underline")))
+        return "".join(r)[:-1]
 
 # SoCLocHandler ------------------------------------------------------------------------------------
 
@@ -412,77 +522,121 @@ class SoCLocHandler(Module):
     # Creation -------------------------------------------------------------------------------------
     def __init__(self, name, n_locs):
         self.name   = name
-        self.locs   = {}
+        self._locs  = {}
         self.n_locs = n_locs
+        # Bitmask of used Locations and lowest Location that may be free.
+        self._used_mask = 0
+        self._next_free = 0
+        # Locations sorted by value for __str__, reset on add.
+        self._sorted_locs = None
+
+    # Locations are only updated through add/bulk_add (to keep used mask in sync): read-only view.
+    @property
+    def locs(self):
+        return types.MappingProxyType(self._locs)
 
     # Add ------------------------------------------------------------------------------------------
     def add(self, name, n=None, use_loc_if_exists=False):
+        locs      = self._locs
+        logger    = self.logger
         allocated = False
-        if not (use_loc_if_exists and name in self.locs.keys()):
-            if name in self.locs.keys():
-                self.logger.error("{} {} name {}.".format(
+        if not (use_loc_if_exists and name in locs):
+            if name in locs:
+                logger.error("{} {} name {}.".format(
                     colorer(name), self.name, colorer("already used", color="red")))
-                self.logger.error(self)
+                logger.error(self)
                 raise
-            if n in self.locs.values():
-                self.logger.error("{} {} Location {}.".format(
+            if (n is not None) and (n >= 0) and (self._used_mask >> n) & 1:
+                logger.error("{} {} Location {}.".format(
                     colorer(n), self.name, colorer("already used", color="red")))
-                self.logger.error(self)
+                logger.error(self)
                 raise
             if n is None:
                 allocated = True
                 n = self.alloc(name)
             else:
                 if n < 0:
-                    self.logger.error("{} {} Location should be {}.".format(
+                    logger.error("{} {} Location should be {}.".format(
                         colorer(n),
                         self.name,
                         colorer("positive", color="red")))
                     raise
                 if n > self.n_locs:
-                    self.logger.error("{} {} Location {} than maximum: {}.".format(
+                    logger.error("{} {} Location {} than maximum: {}.".format(
                         colorer(n),
                         self.name,
                         colorer("higher", color="red"),
                         colorer(self.n_locs)))
                     raise
-            self.locs[name] = n
+            locs[name] = n
+            self._used_mask |= (1 << n)
+            self._sorted_locs = None
         else:
-            n = self.locs[name]
-        self.logger.info("{} {} {} at Location {}.".format(
-            colorer(name, color="underline"),
-            self.name,
-            colorer("allocated" if allocated else "added", color="cyan" if allocated else "green"),
-            colorer(n)))
+            n = locs[name]
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("{} {} {} at Location {}.".format(
+                colorer(name, color="underline"),
+                self.name,
+                colorer("allocated" if allocated else "added", color="cyan" if allocated else "green"),
+                colorer(n)))
+        return n
+
+    # Bulk Add -------------------------------------------------------------------------------------
+    def bulk_add(self, locs):
+        # Check all Locations against the used mask in a single pass.
+        used_mask = self._used_mask
+        for name, n in locs.items():
+            if ((name in self._locs) or (n is None) or (n < 0) or (n > self.n_locs) or
+                (used_mask >> n) & 1):
+                # Locations to allocate or invalid batch: add Locations one by one (allocates or
+                # reports the error).
+                for loc_name, loc_n in locs.items():
+                    self.add(loc_name, loc_n)
+                return
+            used_mask |= (1 << n)
+        self._locs.update(locs)
+        self._used_mask   = used_mask
+        self._sorted_locs = None
+        if locs and self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("{} {} {} at Locations {}.".format(
+                colorer(", ".join(locs), color="underline"),
+                self.name,
+                colorer("added", color="green"),
+                colorer(", ".join(str(n) for n in locs.values()))))
 
     # Alloc ----------------------------------------------------------------------------------------
     def alloc(self, name):
-        for n in range(self.n_locs):
-            if n not in self.locs.values():
-                return n
+        # Find lowest cleared bit of the used mask, starting from the next free hint.
+        free = ~self._used_mask >> self._next_free
+        n    = self._next_free + (free & -free).bit_length() - 1
+        if n < self.n_locs:
+            self._next_free = n
+            return n
         self.logger.error("Not enough Locations.")
         self.logger.error(self)
         raise
 
     # Str ------------------------------------------------------------------------------------------
     def __str__(self):
-        r = "{} Locations: ({})\n".format(self.name, len(self.locs.keys())) if len(self.locs.keys()) else ""
-        locs = {k: v for k, v in sorted(self.locs.items(), key=lambda item: item[1])}
-        length = 0
-        for name in locs.keys():
-            if len(name) > length: length = len(name)
-        for name in locs.keys():
-           r += "- {}{}: {}\n".format(colorer(name, color="underline"), " "*(length + 1 - len(name)), colorer(self.locs[name]))
-        return r
+        r = []
+        if self._locs:
+            r.append("{} Locations: ({})\n".format(self.name, len(self._locs)))
+        if self._sorted_locs is None:
+            self._sorted_locs = sorted(self._locs.items(), key=lambda item: item[1])
+        locs   = self._sorted_locs
+        length = max((len(name) for name, _ in locs), default=0)
+        for name, n in locs:
+           r.append("- {}{}: {}\n".format(colorer(name, color="underline"), " "*(length + 1 - len(name)), colorer(n)))
+        return "".join(r)
 
 # SoCCSRHandler ------------------------------------------------------------------------------------
 
 class SoCCSRHandler(SoCLocHandler):
-    supported_data_width    = [8, 32]
-    supported_address_width = [14+i for i in range(4)]
-    supported_alignment     = [32]
-    supported_paging        = [0x800*2**i for i in range(4)]
-    supported_ordering      = ["big", "little"]
+    supported_data_width    = frozenset({8, 32})
+    supported_address_width = frozenset(14+i for i in range(4))
+    supported_alignment     = frozenset({32})
+    supported_paging        = frozenset(0x800*2**i for i in range(4))
+    supported_ordering      = frozenset({"big", "little"})
 
     # Creation -------------------------------------------------------------------------------------
     def __init__(self, data_width=32, address_width=14, alignment=32, paging=0x800, ordering="big", reserved_csrs={}):
@@ -495,7 +649,7 @@ class SoCCSRHandler(SoCLocHandler):
             self.logger.error("Unsupported {} {}, supporteds: {:s}".format(
                 colorer("Data Width", color="red"),
                 colorer(data_width),
-                colorer(", ".join(str(x) for x in self.supported_data_width))))
+                colorer(", ".join(str(x) for x in sorted(self.supported_data_width)))))
             raise
 
         # Check CSR Address Width.
@@ -503,7 +657,7 @@ class SoCCSRHandler(SoCLocHandler):
             self.logger.error("Unsupported {} {} supporteds: {:s}".format(
                 colorer("Address Width", color="red"),
                 colorer(address_width),
-                colorer(", ".join(str(x) for x in self.supported_address_width))))
+                colorer(", ".join(str(x) for x in sorted(self.supported_address_width)))))
             raise
 
         # Check CSR Alignment.
@@ -511,7 +665,7 @@ class SoCCSRHandler(SoCLocHandler):
             self.logger.error("Unsupported {}: {} supporteds: {:s}".format(
                 colorer("Alignment", color="red"),
                 colorer(alignment),
-                colorer(", ".join(str(x) for x in self.supported_alignment))))
+                colorer(", ".join(str(x) for x in sorted(self.supported_alignment)))))
             raise
         if data_width > alignment:
             self.logger.error("Alignment ({}) {} Data Width ({})".format(
@@ -525,7 +679,7 @@ class SoCCSRHandler(SoCLocHandler):
             self.logger.error("Unsupported {} 0x{}, supporteds: {:s}".format(
                 colorer("Paging", color="red"),
                 colorer("{:x}".format(paging)),
-                colorer(", ".join("0x{:x}".format(x) for x in self.supported_paging))))
+                colorer(", ".join("0x{:x}".format(x) for x in sorted(self.supported_paging)))))
             raise
 
         # Check CSR Ordering.
@@ -533,7 +687,7 @@ class SoCCSRHandler(SoCLocHandler):
             self.logger.error("Unsupported {} {}, supporteds: {:s}".format(
                 colorer("Ordering", color="red"),
                 colorer("{}".format(paging)),
-                colorer(", ".join("{}".format(x) for x in self.supported_ordering))))
+                colorer(", ".join("{}".format(x) for x in sorted(self.supported_ordering)))))
             raise
 
         # Create CSR Handler.
@@ -543,19 +697,20 @@ class SoCCSRHandler(SoCLocHandler):
         self.paging        = paging
         self.ordering      = ordering
         self.masters       = {}
+        self._address_kib  = (1 << address_width)/1024
         self.regions       = {}
-        self.logger.info("{}-bit CSR Bus, {}-bit Aligned, {}KiB Address Space, {}B Paging, {} Ordering (Up to {} Locations).".format(
-            colorer(self.data_width),
-            colorer(self.alignment),
-            colorer(2**self.address_width/2**10),
-            colorer(self.paging),
-            colorer(self.ordering),
-            colorer(self.n_locs)))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("{}-bit CSR Bus, {}-bit Aligned, {}KiB Address Space, {}B Paging, {} Ordering (Up to {} Locations).".format(
+                colorer(self.data_width),
+                colorer(self.alignment),
+                colorer(self._address_kib),
+                colorer(self.paging),
+                colorer(self.ordering),
+                colorer(self.n_locs)))
 
         # Add reserved CSRs.
         self.logger.info("Adding {} CSRs...".format(colorer("reserved", color="cyan")))
-        for name, n in reserved_csrs.items():
-            self.add(name, n)
+        self.bulk_add(reserved_csrs)
 
         self.logger.info("CSR Handler {}.".format(colorer("created", color="green")))
 
@@ -563,7 +718,7 @@ class SoCCSRHandler(SoCLocHandler):
     def add_master(self, name=None, master=None):
         if name is None:
             name = "master{:d}".format(len(self.masters))
-        if name in self.masters.keys():
+        if name in self.masters:
             self.logger.error("{} {} as CSR Master:".format(
                 colorer(name),
                 colorer("already declared", color="red")))
@@ -577,9 +732,10 @@ class SoCCSRHandler(SoCLocHandler):
                 colorer(self.data_width)))
             raise
         self.masters[name] = master
-        self.logger.info("{} {} as CSR Master.".format(
-            colorer(name,    color="underline"),
-            colorer("added", color="green")))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("{} {} as CSR Master.".format(
+                colorer(name,    color="underline"),
+                colorer("added", color="green")))
 
     # Add Region -----------------------------------------------------------------------------------
     def add_region(self, name, region):
@@ -590,22 +746,21 @@ class SoCCSRHandler(SoCLocHandler):
     def address_map(self, name, memory):
         if memory is not None:
             name = name + "_" + memory.name_override
-        if self.locs.get(name, None) is None:
-            self.add(name, use_loc_if_exists=True)
-        return self.locs[name]
+        loc = self.locs.get(name, None)
+        if loc is None:
+            loc = self.add(name, use_loc_if_exists=True)
+        return loc
 
     # Str ------------------------------------------------------------------------------------------
     def __str__(self):
         r = "{}-bit CSR Bus, {}-bit Aligned, {}KiB Address Space, {}B Paging, {} Ordering (Up to {} Locations).\n".format(
             colorer(self.data_width),
             colorer(self.alignment),
-            colorer(2**self.address_width/2**10),
+            colorer(self._address_kib),
             colorer(self.paging),
             colorer(self.ordering),
             colorer(self.n_locs))
-        r += SoCLocHandler.__str__(self)
-        r = r[:-1]
-        return r
+        return "".join([r, SoCLocHandler.__str__(self)])[:-1]
 
 # SoCIRQHandler ------------------------------------------------------------------------------------
 
@@ -628,8 +783,7 @@ class SoCIRQHandler(SoCLocHandler):
 
         # Adding reserved IRQs.
         self.logger.info("Adding {} IRQs...".format(colorer("reserved", color="cyan")))
-        for name, n in reserved_irqs.items():
-            self.add(name, n)
+        self.bulk_add(reserved_irqs)
 
         self.logger.info("IRQ Handler {}.".format(colorer("created", color="green")))
 
@@ -640,18 +794,24 @@ class SoCIRQHandler(SoCLocHandler):
     # Add ------------------------------------------------------------------------------------------
     def add(self, name, *args, **kwargs):
         if self.enabled:
-            SoCLocHandler.add(self, name, *args, **kwargs)
+            return SoCLocHandler.add(self, name, *args, **kwargs)
         else:
             self.logger.error("Attempted to add {} IRQ but SoC does {}.".format(
                 colorer(name), colorer("not support IRQs", color="red")))
             raise
 
+    def bulk_add(self, locs):
+        if self.enabled:
+            SoCLocHandler.bulk_add(self, locs)
+        else:
+            # Report missing IRQ support through add().
+            for name, n in locs.items():
+                self.add(name, n)
+
     # Str ------------------------------------------------------------------------------------------
     def __str__(self):
-        r ="IRQ Handler (up to {} Locations).\n".format(colorer(self.n_locs))
-        r += SoCLocHandler.__str__(self)
-        r = r[:-1]
-        return r
+        r = "IRQ Handler (up to {} Locations).\n".format(colorer(self.n_locs))
+        return "".join([r, SoCLocHandler.__str__(self)])[:-1]
 
 # SoCController ------------------------------------------------------------------------------------
 
@@ -681,15 +841,32 @@ class SoCController(Module, AutoCSR):
         if with_errors:
             self.bus_error = Signal()
             bus_errors     = Signal(32)
+            bus_errors_max = (1 << len(bus_errors)) - 1
             self.sync += [
-                If(bus_errors != (2**len(bus_errors)-1),
-                    If(self.bus_error, bus_errors.eq(bus_errors + 1))
+                If(self.bus_error & (bus_errors != bus_errors_max),
+                    bus_errors.eq(bus_errors + 1)
                 )
             ]
             self.comb += self._bus_errors.status.eq(bus_errors)
 
 # SoC ----------------------------------------------------------------------------------------------
 
+_LITEX_BANNER = tuple(colorer(line, color="bright") for line in (
+    "        __   _ __      _  __  ",
+    "       / /  (_) /____ | |/_/  ",
+    "      / /__/ / __/ -_)>  <    ",
+    "     /____/_/\\__/\\__/_/|_|  ",
+    "  Build your hardware, easily!",
+))
+
+_LITEX_SEPARATOR = colorer("-"*80, color="bright")
+
+# Attributes provided (or lazily created) by migen's Module.__getattr__.
+_MODULE_ATTRS = frozenset({
+    "comb", "sync", "specials", "submodules", "clock_domains", "finalized",
+    "_fragment", "_submodules", "_clock_domains", "get_fragment_called",
+})
+
 class SoC(Module):
     mem_map = {}
     def __init__(self, platform, sys_clk_freq,
@@ -710,15 +887,12 @@ class SoC(Module):
         ):
 
         self.logger = logging.getLogger("SoC")
-        self.logger.info(colorer("        __   _ __      _  __  ", color="bright"))
-        self.logger.info(colorer("       / /  (_) /____ | |/_/  ", color="bright"))
-        self.logger.info(colorer("      / /__/ / __/ -_)>  <    ", color="bright"))
-        self.logger.info(colorer("     /____/_/\\__/\\__/_/|_|  ", color="bright"))
-        self.logger.info(colorer("  Build your hardware, easily!", color="bright"))
+        for line in _LITEX_BANNER:
+            self.logger.info(line)
 
-        self.logger.info(colorer("-"*80, color="bright"))
+        self.logger.info(_LITEX_SEPARATOR)
         self.logger.info(colorer("Creating SoC... ({})".format(build_time())))
-        self.logger.info(colorer("-"*80, color="bright"))
+        self.logger.info(_LITEX_SEPARATOR)
         self.logger.info("FPGA device : {}.".format(platform.device))
         self.logger.info("System clock: {:3.2f}MHz.".format(sys_clk_freq/1e6))
 
@@ -753,19 +927,22 @@ class SoC(Module):
             reserved_irqs = irq_reserved_irqs
         )
 
-        self.logger.info(colorer("-"*80, color="bright"))
-        self.logger.info(colorer("Initial SoC:"))
-        self.logger.info(colorer("-"*80, color="bright"))
-        self.logger.info(self.bus)
-        self.logger.info(self.csr)
-        self.logger.info(self.irq)
-        self.logger.info(colorer("-"*80, color="bright"))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(_LITEX_SEPARATOR)
+            self.logger.info(colorer("Initial SoC:"))
+            self.logger.info(_LITEX_SEPARATOR)
+            self.logger.info(self.bus)
+            self.logger.info(self.csr)
+            self.logger.info(self.irq)
+            self.logger.info(_LITEX_SEPARATOR)
 
         self.add_config("CLOCK_FREQUENCY", int(sys_clk_freq))
 
     # SoC Helpers ----------------------------------------------------------------------------------
     def check_if_exists(self, name):
-        if hasattr(self, name):
+        # SubModules are instance attributes, avoid going through Module.__getattr__ (but still
+        # reject names shadowing class attributes/methods or Module.__getattr__ attributes).
+        if name in self.__dict__ or name in _MODULE_ATTRS or hasattr(type(self), name):
             self.logger.error("{} SubModule already {}.".format(
                 colorer(name),
                 colorer("declared", color="red")))
@@ -773,13 +950,17 @@ class SoC(Module):
 
     def add_constant(self, name, value=None):
         name = name.upper()
-        if name in self.constants.keys():
+        if name in self.constants:
             self.logger.error("{} Constant already {}.".format(
                 colorer(name),
                 colorer("declared", color="red")))
             raise
         self.constants[name] = SoCConstant(value)
 
+    def add_constants(self, **constants):
+        for name, value in constants.items():
+            self.add_constant(name, value)
+
     def add_config(self, name, value=None):
         name = "CONFIG_" + name
         if isinstance(value, str):
@@ -787,10 +968,14 @@ class SoC(Module):
         else:
             self.add_constant(name, value)
 
+    def add_configs(self, **configs):
+        for name, value in configs.items():
+            self.add_config(name, value)
+
     def check_bios_requirements(self):
         # Check for required Peripherals.
         for periph in [ "timer0"]:
-            if periph not in self.csr.locs.keys():
+            if periph not in self.csr.locs:
                 self.logger.error("BIOS needs {} peripheral to be {}.".format(
                     colorer(periph),
                     colorer("used", color="red")))
@@ -799,7 +984,7 @@ class SoC(Module):
 
         # Check for required Memory Regions.
         for mem in ["rom", "sram"]:
-            if mem not in self.bus.regions.keys():
+            if mem not in self.bus.regions:
                 self.logger.error("BIOS needs {} Region to be {} as Bus or Linker Region.".format(
                     colorer(mem),
                     colorer("defined", color="red")))
@@ -812,33 +997,30 @@ class SoC(Module):
         setattr(self.submodules, name, SoCController(**kwargs))
 
     def add_ram(self, name, origin, size, contents=[], mode="rw"):
-        ram_cls = {
-            "wishbone": wishbone.SRAM,
-            "axi-lite": axi.AXILiteSRAM,
-        }[self.bus.standard]
-        interface_cls = {
-            "wishbone": wishbone.Interface,
-            "axi-lite": axi.AXILiteInterface,
-        }[self.bus.standard]
+        ram_cls       = _RAM_CLS[self.bus.standard]
+        interface_cls = _MAIN_BUS_CLS[self.bus.standard]
         ram_bus = interface_cls(data_width=self.bus.data_width)
-        ram     = ram_cls(size, bus=ram_bus, init=contents, read_only=(mode == "r"))
-        self.bus.add_slave(name, ram.bus, SoCRegion(origin=origin, size=size, mode=mode))
+        region  = SoCRegion(origin=origin, size=size, mode=mode)
+        ram     = ram_cls(size, bus=ram_bus, init=contents, read_only=region.read_only)
+        self.bus.add_slave(name, ram.bus, region)
         self.check_if_exists(name)
-        self.logger.info("RAM {} {} {}.".format(
-            colorer(name),
-            colorer("added", color="green"),
-            self.bus.regions[name]))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("RAM {} {} {}.".format(
+                colorer(name),
+                colorer("added", color="green"),
+                self.bus.regions[name]))
         setattr(self.submodules, name, ram)
 
     def add_rom(self, name, origin, size, contents=[], mode="r"):
         self.add_ram(name, origin, size, contents, mode=mode)
 
     def init_rom(self, name, contents=[], auto_size=True):
-        self.logger.info("Initializing ROM {} with contents (Size: {}).".format(
-            colorer(name),
-            colorer(f"0x{4*len(contents):x}")))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Initializing ROM {} with contents (Size: {}).".format(
+                colorer(name),
+                colorer(f"0x{4*len(contents):x}")))
         getattr(self, name).mem.init = contents
-        if auto_size and self.bus.regions[name].mode == "r":
+        if auto_size and self.bus.regions[name].read_only:
             self.logger.info("Auto-Resizing ROM {} from {} to {}.".format(
                 colorer(name),
                 colorer(f"0x{self.bus.regions[name].size:x}"),
@@ -846,27 +1028,25 @@ class SoC(Module):
             getattr(self, name).mem.depth = len(contents)
 
     def add_csr_bridge(self, origin, register=False):
-        csr_bridge_cls = {
-            "wishbone": wishbone.Wishbone2CSR,
-            "axi-lite": axi.AXILite2CSR,
-        }[self.bus.standard]
+        csr_bridge_cls = _CSR_BRIDGE_CLS[self.bus.standard]
         self.check_if_exists("csr_bridge")
         self.submodules.csr_bridge = csr_bridge_cls(
             bus_csr       = csr_bus.Interface(
             address_width = self.csr.address_width,
             data_width    = self.csr.data_width),
             register      = register)
-        csr_size   = 2**(self.csr.address_width + 2)
+        csr_size   = 1 << (self.csr.address_width + 2)
         csr_region = SoCRegion(origin=origin, size=csr_size, cached=False)
         bus = getattr(self.csr_bridge, self.bus.standard.replace('-', '_'))
         self.bus.add_slave("csr", bus, csr_region)
         self.csr.add_master(name="bridge", master=self.csr_bridge.csr)
-        self.add_config("CSR_DATA_WIDTH", self.csr.data_width)
-        self.add_config("CSR_ALIGNMENT",  self.csr.alignment)
+        self.add_configs(
+            CSR_DATA_WIDTH = self.csr.data_width,
+            CSR_ALIGNMENT  = self.csr.alignment)
 
     def add_cpu(self, name="vexriscv", variant="standard", cls=None, reset_address=None, cfu=None):
         # Check that CPU is supported.
-        if name not in cpu.CPUS.keys():
+        if name not in cpu.CPUS:
             self.logger.error("{} CPU {}, supporteds: {}.".format(
                 colorer(name),
                 colorer("not supported", color="red"),
@@ -903,14 +1083,17 @@ class SoC(Module):
             self.mem_map = {**self.cpu.mem_map, **self.mem_map}
         else:
             # Override User's mapping with CPU constrainted mapping (and warn User).
-            for n, origin in self.cpu.mem_map.items():
-                if n in self.mem_map.keys():
+            user_map = self.mem_map
+            cpu_map  = self.cpu.mem_map
+            for n, origin in cpu_map.items():
+                user_origin = user_map.get(n, None)
+                if (user_origin is not None) and (user_origin != origin):
                     self.logger.info("CPU {} {} mapping from {} to {}.".format(
                         colorer("overriding", color="cyan"),
                         colorer(n),
-                        colorer(f"0x{self.mem_map[n]:x}"),
-                        colorer(f"0x{self.cpu.mem_map[n]:x}")))
-            self.mem_map.update(self.cpu.mem_map)
+                        colorer(f"0x{user_origin:x}"),
+                        colorer(f"0x{origin:x}")))
+            user_map.update(cpu_map)
 
         # Add Bus Masters/CSR/IRQs.
         if not isinstance(self.cpu, (cpu.CPUNone, cpu.Zynq7000)):
@@ -951,14 +1134,14 @@ class SoC(Module):
             self.cpu.add_soc_components(soc=self, soc_region_cls=SoCRegion) # FIXME: avoid passing SoCRegion.
 
         # Add constants.
-        self.add_config("CPU_TYPE",    str(name))
-        self.add_config("CPU_VARIANT", str(variant.split('+')[0]))
+        self.add_configs(
+            CPU_TYPE    = str(name),
+            CPU_VARIANT = str(variant.split('+')[0]))
         self.add_constant("CONFIG_CPU_HUMAN_NAME", getattr(self.cpu, "human_name", "Unknown"))
         if hasattr(self.cpu, "nop"):
             self.add_constant("CONFIG_CPU_NOP", self.cpu.nop)
 
     def add_timer(self, name="timer0"):
-        from litex.soc.cores.timer import Timer
         self.check_if_exists(name)
         setattr(self.submodules, name, Timer())
         if self.irq.enabled:
@@ -966,35 +1149,34 @@ class SoC(Module):
 
     # SoC finalization -----------------------------------------------------------------------------
     def do_finalize(self):
-        interconnect_p2p_cls = {
-            "wishbone": wishbone.InterconnectPointToPoint,
-            "axi-lite": axi.AXILiteInterconnectPointToPoint,
-        }[self.bus.standard]
-        interconnect_shared_cls = {
-            "wishbone": wishbone.InterconnectShared,
-            "axi-lite": axi.AXILiteInterconnectShared,
-        }[self.bus.standard]
+        interconnect_p2p_cls    = _INTERCONNECT_P2P_CLS[self.bus.standard]
+        interconnect_shared_cls = _INTERCONNECT_SHARED_CLS[self.bus.standard]
+        ctrl    = getattr(self, "ctrl",    None)
+        crg     = getattr(self, "crg",     None)
+        dma_bus = getattr(self, "dma_bus", None)
 
         # SoC Reset --------------------------------------------------------------------------------
         # Connect soc_rst to CRG's rst if presents.
-        if hasattr(self, "ctrl") and hasattr(self, "crg"):
-            crg_rst = getattr(self.crg, "rst", None)
+        if (ctrl is not None) and (crg is not None):
+            crg_rst = getattr(crg, "rst", None)
             if isinstance(crg_rst, Signal):
-                self.comb += crg_rst.eq(getattr(self.ctrl, "soc_rst", 0))
+                self.comb += crg_rst.eq(getattr(ctrl, "soc_rst", 0))
 
         # SoC CSR bridge ---------------------------------------------------------------------------
         # FIXME: for now, use registered CSR bridge when SDRAM is present; find the best compromise.
         self.add_csr_bridge(self.mem_map["csr"], register=hasattr(self, "sdram"))
 
         # SoC Bus Interconnect ---------------------------------------------------------------------
-        if len(self.bus.masters) and len(self.bus.slaves):
+        if self.bus.masters and self.bus.slaves:
+            masters = tuple(self.bus.masters.values())
+            slaves  = tuple(self.bus.slaves.items())
             # If 1 bus_master, 1 bus_slave and no address translation, use InterconnectPointToPoint.
-            if ((len(self.bus.masters) == 1)  and
-                (len(self.bus.slaves)  == 1)  and
-                (next(iter(self.bus.regions.values())).origin == 0)):
+            if ((len(masters) == 1)  and
+                (len(slaves)  == 1)  and
+                (self.bus.regions[slaves[0][0]].origin == 0)):
                 self.submodules.bus_interconnect = interconnect_p2p_cls(
-                    master = next(iter(self.bus.masters.values())),
-                    slave  = next(iter(self.bus.slaves.values())))
+                    master = masters[0],
+                    slave  = slaves[0][1])
             # Otherwise, use InterconnectShared.
             else:
                 self.submodules.bus_interconnect = interconnect_shared_cls(
@@ -1002,9 +1184,9 @@ class SoC(Module):
                     slaves         = [(self.bus.regions[n].decoder(self.bus), s) for n, s in self.bus.slaves.items()],
                     register       = True,
                     timeout_cycles = self.bus.timeout)
-                if hasattr(self, "ctrl") and self.bus.timeout is not None:
-                    if hasattr(self.ctrl, "bus_error"):
-                        self.comb += self.ctrl.bus_error.eq(self.bus_interconnect.timeout.error)
+                if (ctrl is not None) and (self.bus.timeout is not None):
+                    if hasattr(ctrl, "bus_error"):
+                        self.comb += ctrl.bus_error.eq(self.bus_interconnect.timeout.error)
             self.bus.logger.info("Interconnect: {} ({} <-> {}).".format(
                 colorer(self.bus_interconnect.__class__.__name__),
                 colorer(len(self.bus.masters)),
@@ -1014,25 +1196,27 @@ class SoC(Module):
         self.add_constant("CONFIG_BUS_ADDRESS_WIDTH", self.bus.address_width)
 
         # SoC DMA Bus Interconnect (Cache Coherence) -----------------------------------------------
-        if hasattr(self, "dma_bus"):
-            if len(self.dma_bus.masters) and len(self.dma_bus.slaves):
+        if dma_bus is not None:
+            if dma_bus.masters and dma_bus.slaves:
+                masters = tuple(dma_bus.masters.values())
+                slaves  = tuple(dma_bus.slaves.items())
                 # If 1 bus_master, 1 bus_slave and no address translation, use InterconnectPointToPoint.
-                if ((len(self.dma_bus.masters) == 1)  and
-                    (len(self.dma_bus.slaves)  == 1)  and
-                    (next(iter(self.dma_bus.regions.values())).origin == 0)):
+                if ((len(masters) == 1)  and
+                    (len(slaves)  == 1)  and
+                    (dma_bus.regions[slaves[0][0]].origin == 0)):
                     self.submodules.dma_bus_interconnect = wishbone.InterconnectPointToPoint(
-                        master = next(iter(self.dma_bus.masters.values())),
-                        slave  = next(iter(self.dma_bus.slaves.values())))
+                        master = masters[0],
+                        slave  = slaves[0][1])
                 # Otherwise, use InterconnectShared.
                 else:
                     self.submodules.dma_bus_interconnect = wishbone.InterconnectShared(
-                        masters        = self.dma_bus.masters.values(),
-                        slaves         = [(self.dma_bus.regions[n].decoder(self.dma_bus), s) for n, s in self.dma_bus.slaves.items()],
+                        masters        = dma_bus.masters.values(),
+                        slaves         = [(dma_bus.regions[n].decoder(dma_bus), s) for n, s in dma_bus.slaves.items()],
                         register       = True)
                 self.bus.logger.info("DMA Interconnect: {} ({} <-> {}).".format(
                     colorer(self.dma_bus_interconnect.__class__.__name__),
-                    colorer(len(self.dma_bus.masters)),
-                    colorer(len(self.dma_bus.slaves))))
+                    colorer(len(dma_bus.masters)),
+                    colorer(len(dma_bus.slaves))))
             self.add_constant("CONFIG_CPU_HAS_DMA_BUS")
 
         # SoC CSR Interconnect ---------------------------------------------------------------------
@@ -1044,27 +1228,37 @@ class SoC(Module):
             paging             = self.csr.paging,
             ordering           = self.csr.ordering,
             soc_bus_data_width = self.bus.data_width)
-        if len(self.csr.masters):
+        if self.csr.masters:
             self.submodules.csr_interconnect = csr_bus.InterconnectShared(
                 masters = list(self.csr.masters.values()),
                 slaves  = self.csr_bankarray.get_buses())
 
-        # Add CSRs regions.
-        for name, csrs, mapaddr, rmap in self.csr_bankarray.banks:
-            self.csr.add_region(name, SoCCSRRegion(
-                origin   = (self.bus.regions["csr"].origin + self.csr.paging*mapaddr),
-                busword  = self.csr.data_width,
+        csr_origin  = self.bus.regions["csr"].origin
+        csr_paging  = self.csr.paging
+        csr_busword = self.csr.data_width
+
+        # Create CSRs regions.
+        csr_regions = [(name, SoCCSRRegion(
+                origin   = (csr_origin + csr_paging*mapaddr),
+                busword  = csr_busword,
                 obj      = csrs))
+            for name, csrs, mapaddr, rmap in self.csr_bankarray.banks]
 
-        # Add Memory regions.
-        for name, memory, mapaddr, mmap in self.csr_bankarray.srams:
-            self.csr.add_region(name + "_" + memory.name_override, SoCCSRRegion(
-                origin  = (self.bus.regions["csr"].origin + self.csr.paging*mapaddr),
-                busword = self.csr.data_width,
+        # Create Memory regions.
+        csr_regions += [(name + "_" + memory.name_override, SoCCSRRegion(
+                origin  = (csr_origin + csr_paging*mapaddr),
+                busword = csr_busword,
                 obj     = memory))
+            for name, memory, mapaddr, mmap in self.csr_bankarray.srams]
 
-        # Sort CSR regions by origin.
-        self.csr.regions = {k: v for k, v in sorted(self.csr.regions.items(), key=lambda item: item[1].origin)}
+        # Add CSR regions sorted by origin (re-sort in place only when CSR regions were already present).
+        csr_regions_present = bool(self.csr.regions)
+        csr_regions.sort(key=lambda item: item[1].origin)
+        self.csr.regions.update(csr_regions)
+        if csr_regions_present:
+            for name, region in sorted(self.csr.regions.items(), key=lambda item: item[1].origin):
+                del self.csr.regions[name]
+                self.csr.regions[name] = region
 
         # Add CSRs / Config items to constants.
         for name, constant in self.csr_bankarray.constants:
@@ -1072,14 +1266,15 @@ class SoC(Module):
 
         # SoC CPU Check ----------------------------------------------------------------------------
         if not isinstance(self.cpu, (cpu.CPUNone, cpu.Zynq7000)):
-            cpu_reset_address_valid = False
-            for name, container in self.bus.regions.items():
-                if self.bus.check_region_is_in(
-                    region    = SoCRegion(origin=self.cpu.reset_address, size=self.bus.data_width//8),
-                    container = container):
-                    cpu_reset_address_valid = True
-                    if name == "rom":
-                        self.cpu.use_rom = True
+            cpu_reset_region = SoCRegion(origin=self.cpu.reset_address, size=self.bus.data_width//8)
+            # Check ROM first (Linker regions can overlap), then stop on the first containing Region.
+            rom = self.bus.regions.get("rom", None)
+            if (rom is not None) and self.bus.check_region_is_in(cpu_reset_region, rom):
+                self.cpu.use_rom = True
+                cpu_reset_address_valid = True
+            else:
+                cpu_reset_address_valid = any(self.bus.check_region_is_in(cpu_reset_region, container)
+                    for container in self.bus.regions.values())
             if not cpu_reset_address_valid:
                 self.logger.error("CPU needs {} to be in a {} Region.".format(
                     colorer("reset address 0x{:08x}".format(self.cpu.reset_address)),
@@ -1089,8 +1284,10 @@ class SoC(Module):
 
         # SoC IRQ Interconnect ---------------------------------------------------------------------
         if hasattr(self, "cpu") and hasattr(self.cpu, "interrupt"):
+            cpu_interrupt  = self.cpu.interrupt
+            cpu_interrupts = self.cpu.interrupts
             for name, loc in sorted(self.irq.locs.items()):
-                if name in self.cpu.interrupts.keys():
+                if name in cpu_interrupts:
                     continue
                 if hasattr(self, name):
                     module = getattr(self, name)
@@ -1104,19 +1301,20 @@ class SoC(Module):
                             colorer("not found", color="red"),
                             colorer(name)))
                         raise
-                    self.comb += self.cpu.interrupt[loc].eq(ev.irq)
+                    self.comb += cpu_interrupt[loc].eq(ev.irq)
                 self.add_constant(name + "_INTERRUPT", loc)
 
         # SoC Infos --------------------------------------------------------------------------------
-        self.logger.info(colorer("-"*80, color="bright"))
-        self.logger.info(colorer("Finalized SoC:"))
-        self.logger.info(colorer("-"*80, color="bright"))
-        self.logger.info(self.bus)
-        if hasattr(self, "dma_bus"):
-            self.logger.info(self.dma_bus)
-        self.logger.info(self.csr)
-        self.logger.info(self.irq)
-        self.logger.info(colorer("-"*80, color="bright"))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(_LITEX_SEPARATOR)
+            self.logger.info(colorer("Finalized SoC:"))
+            self.logger.info(_LITEX_SEPARATOR)
+            self.logger.info(self.bus)
+            if dma_bus is not None:
+                self.logger.info(dma_bus)
+            self.logger.info(self.csr)
+            self.logger.info(self.irq)
+            self.logger.info(_LITEX_SEPARATOR)
 
     # SoC build ------------------------------------------------------------------------------------
     def build(self, *args, **kwargs):
@@ -1131,7 +1329,6 @@ class SoC(Module):
 class LiteXSoC(SoC):
     # Add Identifier -------------------------------------------------------------------------------
     def add_identifier(self, name="identifier", identifier="LiteX SoC", with_build_time=True):
-        from litex.soc.cores.identifier import Identifier
         self.check_if_exists(name)
         if with_build_time:
             identifier += " " + build_time()
@@ -1140,50 +1337,47 @@ class LiteXSoC(SoC):
 
     # Add UART -------------------------------------------------------------------------------------
     def add_uart(self, name, baudrate=115200, fifo_depth=16):
-        from litex.soc.cores import uart
         self.check_if_exists("uart")
 
         # Stub / Stream.
-        if name in ["stub", "stream"]:
+        if name in ("stub", "stream"):
             self.submodules.uart = uart.UART(tx_fifo_depth=0, rx_fifo_depth=0)
             if name == "stub":
                 self.comb += self.uart.sink.ready.eq(1)
 
         # UARTBone / Bridge.
-        elif name in ["uartbone", "bridge"]:
+        elif name in ("uartbone", "bridge"):
             self.add_uartbone(baudrate=baudrate)
 
         # Crossover.
-        elif name in ["crossover"]:
+        elif name == "crossover":
             self.submodules.uart = uart.UARTCrossover(
                 tx_fifo_depth = fifo_depth,
                 rx_fifo_depth = fifo_depth)
 
         # Crossover + Bridge.
-        elif name in ["crossover+bridge"]:
+        elif name == "crossover+bridge":
             self.add_uartbone(baudrate=baudrate)
             self.submodules.uart = uart.UARTCrossover(
                 tx_fifo_depth = fifo_depth,
                 rx_fifo_depth = fifo_depth)
 
         # Model/Sim.
-        elif name in ["model", "sim"]:
+        elif name in ("model", "sim"):
             self.submodules.uart_phy = uart.RS232PHYModel(self.platform.request("serial"))
             self.submodules.uart = uart.UART(self.uart_phy,
                 tx_fifo_depth = fifo_depth,
                 rx_fifo_depth = fifo_depth)
 
         # JTAG Atlantic.
-        elif name in ["jtag_atlantic"]:
-            from litex.soc.cores.jtag import JTAGAtlantic
+        elif name == "jtag_atlantic":
             self.submodules.uart_phy = JTAGAtlantic()
             self.submodules.uart = uart.UART(self.uart_phy,
                 tx_fifo_depth = fifo_depth,
                 rx_fifo_depth = fifo_depth)
 
         # JTAG UART.
-        elif name in ["jtag_uart"]:
-            from litex.soc.cores.jtag import JTAGPHY
+        elif name == "jtag_uart":
             self.clock_domains.cd_sys_jtag = ClockDomain()          # Run JTAG-UART in sys_jtag clock domain similar to
             self.comb += self.cd_sys_jtag.clk.eq(ClockSignal("sys")) # sys clock domain but with rst disconnected.
             self.submodules.uart_phy = JTAGPHY(device=self.platform.device, clock_domain="sys_jtag")
@@ -1192,7 +1386,7 @@ class LiteXSoC(SoC):
                 rx_fifo_depth = fifo_depth)
 
         # USB ACM (with ValentyUSB core).
-        elif name in ["usb_acm"]:
+        elif name == "usb_acm":
             import valentyusb.usbcore.io as usbio
             import valentyusb.usbcore.cpu.cdc_eptri as cdc_eptri
             usb_pads = self.platform.request("usb")
@@ -1218,7 +1412,6 @@ class LiteXSoC(SoC):
 
     # Add UARTbone ---------------------------------------------------------------------------------
     def add_uartbone(self, name="serial", clk_freq=None, baudrate=115200, cd="sys"):
-        from litex.soc.cores import uart
         if clk_freq is None:
             clk_freq = self.sys_clk_freq
         self.check_if_exists("uartbone")
@@ -1228,8 +1421,6 @@ class LiteXSoC(SoC):
 
     # Add JTAGbone ---------------------------------------------------------------------------------
     def add_jtagbone(self, chain=1):
-        from litex.soc.cores import uart
-        from litex.soc.cores.jtag import JTAGPHY
         self.check_if_exists("jtabone")
         self.submodules.jtagbone_phy = JTAGPHY(device=self.platform.device, chain=chain)
         self.submodules.jtagbone = uart.UARTBone(phy=self.jtagbone_phy, clk_freq=self.sys_clk_freq)
@@ -1263,15 +1454,10 @@ class LiteXSoC(SoC):
         if hasattr(module, "_spd_data"):
             # Pack the data into words of bus width.
             bytes_per_word = self.bus.data_width // 8
-            mem = [0] * ceil(len(module._spd_data) / bytes_per_word)
-            for i in range(len(mem)):
-                for offset in range(bytes_per_word):
-                    mem[i] <<= 8
-                    if self.cpu.endianness == "little":
-                        offset = bytes_per_word - 1 - offset
-                    spd_byte = i * bytes_per_word + offset
-                    if spd_byte < len(module._spd_data):
-                        mem[i] |= module._spd_data[spd_byte]
+            byteorder      = "little" if self.cpu.endianness == "little" else "big"
+            spd_data       = bytes(module._spd_data) + bytes(-len(module._spd_data) % bytes_per_word)
+            mem = [int.from_bytes(spd_data[i:i + bytes_per_word], byteorder)
+                for i in range(0, len(spd_data), bytes_per_word)]
             self.add_rom(
                 name     = "spd",
                 origin   = self.mem_map.get("spd", None),
@@ -1294,7 +1480,7 @@ class LiteXSoC(SoC):
             sdram_size = min(sdram_size, size)
 
         # Add SDRAM region.
-        self.bus.add_region("main_ram", SoCRegion(origin=self.mem_map.get("main_ram", origin), size=sdram_size))
+        main_ram_region = self.bus.add_region("main_ram", SoCRegion(origin=self.mem_map.get("main_ram", origin), size=sdram_size))
 
         # Add CPU's direct memory buses (if not already declared) ----------------------------------
         if hasattr(self.cpu, "add_memory_buses"):
@@ -1304,12 +1490,12 @@ class LiteXSoC(SoC):
             )
 
         # Connect CPU's direct memory buses to LiteDRAM --------------------------------------------
-        if len(self.cpu.memory_buses):
+        if self.cpu.memory_buses:
             # When CPU has at least a direct memory bus, connect them directly to LiteDRAM.
             for mem_bus in self.cpu.memory_buses:
                 # Request a LiteDRAM native port.
                 port = self.sdram.crossbar.get_port()
-                port.data_width = 2**int(log2(port.data_width)) # Round to nearest power of 2.
+                port.data_width = _prev_pow2(port.data_width) # Round to nearest power of 2.
 
                 # Check if bus is an AXI bus and connect it.
                 if isinstance(mem_bus, axi.AXIInterface):
@@ -1319,7 +1505,7 @@ class LiteXSoC(SoC):
                         self.submodules += LiteDRAMAXI2Native(
                             axi          = self.cpu.mem_axi,
                             port         = port,
-                            base_address = self.bus.regions["main_ram"].origin)
+                            base_address = main_ram_region.origin)
                     # If different data_width, do the adaptation and connect it via Wishbone.
                     else:
                         self.logger.info("Converting MEM data width: {} to {} via Wishbone".format(
@@ -1340,7 +1526,7 @@ class LiteXSoC(SoC):
                         self.submodules += LiteDRAMWishbone2Native(
                             wishbone     = litedram_wb,
                             port         = port,
-                            base_address = self.bus.regions["main_ram"].origin)
+                            base_address = main_ram_region.origin)
                         self.submodules += wishbone.Converter(mem_wb, litedram_wb)
                 # Check if bus is a Native bus and connect it.
                 if isinstance(mem_bus, LiteDRAMNativePort):
@@ -1356,14 +1542,14 @@ class LiteXSoC(SoC):
         # Connect Main bus to LiteDRAM (with optional L2 Cache) ------------------------------------
         connect_main_bus_to_dram = (
             # No memory buses.
-            (not len(self.cpu.memory_buses)) or
+            (not self.cpu.memory_buses) or
             # Memory buses but no DMA bus.
-            (len(self.cpu.memory_buses) and not hasattr(self.cpu, "dma_bus"))
+            (self.cpu.memory_buses and not hasattr(self.cpu, "dma_bus"))
         )
         if connect_main_bus_to_dram:
             # Request a LiteDRAM native port.
             port = self.sdram.crossbar.get_port()
-            port.data_width = 2**int(log2(port.data_width)) # Round to nearest power of 2.
+            port.data_width = _prev_pow2(port.data_width) # Round to nearest power of 2.
 
             # Create Wishbone Slave.
             wb_sdram = wishbone.Interface()
@@ -1373,7 +1559,7 @@ class LiteXSoC(SoC):
             if l2_cache_size != 0:
                 # Insert L2 cache inbetween Wishbone bus and LiteDRAM
                 l2_cache_size = max(l2_cache_size, int(2*port.data_width/8)) # Use minimal size if lower
-                l2_cache_size = 2**int(log2(l2_cache_size))                  # Round to nearest power of 2
+                l2_cache_size = _prev_pow2(l2_cache_size)                    # Round to nearest power of 2
                 l2_cache_data_width = max(port.data_width, l2_cache_min_data_width)
                 l2_cache = wishbone.Cache(
                     cachesize = l2_cache_size//4,
@@ -1393,7 +1579,7 @@ class LiteXSoC(SoC):
             self.submodules.wishbone_bridge = LiteDRAMWishbone2Native(
                 wishbone     = litedram_wb,
                 port         = port,
-                base_address = self.bus.regions["main_ram"].origin)
+                base_address = main_ram_region.origin)
 
     # Add Ethernet ---------------------------------------------------------------------------------
     def add_ethernet(self, name="ethmac", phy=None, phy_cd="eth", dynamic_ip=False, software_debug=False,
@@ -1431,8 +1617,9 @@ class LiteXSoC(SoC):
             self.irq.add(name, use_loc_if_exists=True)
 
         # Timing constraints
-        eth_rx_clk = getattr(phy, "crg", phy).cd_eth_rx.clk
-        eth_tx_clk = getattr(phy, "crg", phy).cd_eth_tx.clk
+        eth_crg    = getattr(phy, "crg", phy)
+        eth_rx_clk = eth_crg.cd_eth_rx.clk
+        eth_tx_clk = eth_crg.cd_eth_tx.clk
         if not isinstance(phy, LiteEthPHYModel):
             self.platform.add_period_constraint(eth_rx_clk, 1e9/phy.rx_clk_freq)
             self.platform.add_period_constraint(eth_tx_clk, 1e9/phy.tx_clk_freq)
@@ -1483,8 +1670,9 @@ class LiteXSoC(SoC):
         self.add_wb_master(etherbone.wishbone.bus)
 
         # Timing constraints
-        eth_rx_clk = getattr(phy, "crg", phy).cd_eth_rx.clk
-        eth_tx_clk = getattr(phy, "crg", phy).cd_eth_tx.clk
+        eth_crg    = getattr(phy, "crg", phy)
+        eth_rx_clk = eth_crg.cd_eth_rx.clk
+        eth_tx_clk = eth_crg.cd_eth_tx.clk
         if not isinstance(phy, LiteEthPHYModel):
             self.platform.add_period_constraint(eth_rx_clk, 1e9/phy.rx_clk_freq)
             self.platform.add_period_constraint(eth_tx_clk, 1e9/phy.tx_clk_freq)
@@ -1529,9 +1717,6 @@ class LiteXSoC(SoC):
 
     # Add SPI SDCard -------------------------------------------------------------------------------
     def add_spi_sdcard(self, name="spisdcard", spi_clk_freq=400e3, software_debug=False):
-        # Imports.
-        from litex.soc.cores.spi import SPIMaster
-
         # Pads.
         pads = self.platform.request(name)
         if hasattr(pads, "rst"):
@@ -1658,15 +1843,14 @@ class LiteXSoC(SoC):
             dma_bus.add_master("sata_mem2sector", master=bus)
 
         # Timing constraints.
-        self.platform.add_period_constraint(self.sata_phy.crg.cd_sata_tx.clk, 1e9/sata_clk_freq)
-        self.platform.add_period_constraint(self.sata_phy.crg.cd_sata_rx.clk, 1e9/sata_clk_freq)
-        self.platform.add_false_path_constraints(
-            self.crg.cd_sys.clk,
-            self.sata_phy.crg.cd_sata_tx.clk,
-            self.sata_phy.crg.cd_sata_rx.clk)
+        sata_tx_clk = self.sata_phy.crg.cd_sata_tx.clk
+        sata_rx_clk = self.sata_phy.crg.cd_sata_rx.clk
+        self.platform.add_period_constraint(sata_tx_clk, 1e9/sata_clk_freq)
+        self.platform.add_period_constraint(sata_rx_clk, 1e9/sata_clk_freq)
+        self.platform.add_false_path_constraints(self.crg.cd_sys.clk, sata_tx_clk, sata_rx_clk)
 
     # Add PCIe -------------------------------------------------------------------------------------
-    def add_pcie(self, name="pcie", phy=None, ndmas=0, max_pending_requests=8, with_msi=True):
+    def add_pcie(self, name="pcie", phy=None, ndmas=0, max_pending_requests=8, with_msi=True, dma_buffering_depth=1024):
         # Imports
         from litepcie.core import LitePCIeEndpoint, LitePCIeMSI
         from litepcie.frontend.dma import LitePCIeDMA
@@ -1699,7 +1883,7 @@ class LiteXSoC(SoC):
             assert with_msi
             self.check_if_exists(f"{name}_dma{i}")
             dma = LitePCIeDMA(phy, endpoint,
-                with_buffering = True, buffering_depth=1024,
+                with_buffering = True, buffering_depth=dma_buffering_depth,
                 with_loopback  = True)
             setattr(self.submodules, f"{name}_dma{i}", dma)
             self.msis[f"{name.upper()}_DMA{i}_WRITER"] = dma.writer.irq
@@ -1717,13 +1901,11 @@ class LiteXSoC(SoC):
 
     # Add Video ColorBars Pattern ------------------------------------------------------------------
     def add_video_colorbars(self, name="video_colorbars", phy=None, timings="800x600@60Hz", clock_domain="sys"):
-        # Imports.
-        from litex.soc.cores.video import VideoTimingGenerator, ColorBarsPattern
-
         # Video Timing Generator.
         self.check_if_exists(f"{name}_vtg")
-        vtg = VideoTimingGenerator(default_video_timings=timings if isinstance(timings, str) else timings[1])
-        vtg = ClockDomainsRenamer(clock_domain)(vtg)
+        vtg = VideoTimingGenerator(
+            default_video_timings = timings if isinstance(timings, str) else timings[1],
+            clock_domain          = clock_domain)
         setattr(self.submodules, f"{name}_vtg", vtg)
 
         # ColorsBars Pattern.
@@ -1738,21 +1920,19 @@ class LiteXSoC(SoC):
         ]
 
     # Add Video Terminal ---------------------------------------------------------------------------
-    def add_video_terminal(self, name="video_terminal", phy=None, timings="800x600@60Hz", clock_domain="sys"):
-        # Imports.
-        from litex.soc.cores.video import VideoTimingGenerator, VideoTerminal
-
+    def add_video_terminal(self, name="video_terminal", phy=None, timings="800x600@60Hz", clock_domain="sys", uart_cdc_depth=4):
         # Video Timing Generator.
         self.check_if_exists(f"{name}_vtg")
-        vtg = VideoTimingGenerator(default_video_timings=timings if isinstance(timings, str) else timings[1])
-        vtg = ClockDomainsRenamer(clock_domain)(vtg)
+        vtg = VideoTimingGenerator(
+            default_video_timings = timings if isinstance(timings, str) else timings[1],
+            clock_domain          = clock_domain)
         setattr(self.submodules, f"{name}_vtg", vtg)
 
         # Video Terminal.
-        timings = timings if isinstance(timings, str) else timings[0]
+        hres, vres = _video_resolution(timings)
         vt = VideoTerminal(
-            hres = int(timings.split("@")[0].split("x")[0]),
-            vres = int(timings.split("@")[0].split("x")[1]),
+            hres = hres,
+            vres = vres,
         )
         vt = ClockDomainsRenamer(clock_domain)(vt)
         setattr(self.submodules, name, vt)
@@ -1761,7 +1941,7 @@ class LiteXSoC(SoC):
         self.comb += vtg.source.connect(vt.vtg_sink)
 
         # Connect UART to Video Terminal.
-        uart_cdc = stream.ClockDomainCrossing([("data", 8)], cd_from="sys", cd_to=clock_domain)
+        uart_cdc = stream.ClockDomainCrossing([("data", 8)], cd_from="sys", cd_to=clock_domain, depth=uart_cdc_depth)
         setattr(self.submodules, f"{name}_uart_cdc", uart_cdc)
         self.comb += [
             uart_cdc.sink.valid.eq(self.uart.tx_fifo.source.valid & self.uart.tx_fifo.source.ready),
@@ -1774,20 +1954,16 @@ class LiteXSoC(SoC):
 
     # Add Video Framebuffer ------------------------------------------------------------------------
     def add_video_framebuffer(self, name="video_framebuffer", phy=None, timings="800x600@60Hz", clock_domain="sys"):
-        # Imports.
-        from litex.soc.cores.video import VideoTimingGenerator, VideoFrameBuffer
-
         # Video Timing Generator.
-        vtg = VideoTimingGenerator(default_video_timings=timings if isinstance(timings, str) else timings[1])
-        vtg = ClockDomainsRenamer(clock_domain)(vtg)
+        vtg = VideoTimingGenerator(
+            default_video_timings = timings if isinstance(timings, str) else timings[1],
+            clock_domain          = clock_domain)
         setattr(self.submodules, f"{name}_vtg", vtg)
 
         # Video FrameBuffer.
-        timings = timings if isinstance(timings, str) else timings[0]
         base = self.mem_map.get(name, 0x40c00000)
-        hres = int(timings.split("@")[0].split("x")[0])
-        vres = int(timings.split("@")[0].split("x")[1])
-        vfb = VideoFrameBuffer(self.sdram.crossbar.get_port(),
+        hres, vres = _video_resolution(timings)
+        vfb = VideoFrameBuffer(self.sdram.crossbar.get_port(mode="read"),
             hres = hres,
             vres = vres,
             base = base,
@@ -1803,6 +1979,7 @@ class LiteXSoC(SoC):
         self.comb += vfb.source.connect(phy if isinstance(phy, stream.Endpoint) else phy.sink)
 
         # Constants.
-        self.add_constant("VIDEO_FRAMEBUFFER_BASE", base)
-        self.add_constant("VIDEO_FRAMEBUFFER_HRES", hres)
-        self.add_constant("VIDEO_FRAMEBUFFER_VRES", vres)
+        self.add_constants(
+            VIDEO_FRAMEBUFFER_BASE = base,
+            VIDEO_FRAMEBUFFER_HRES = hres,
+            VIDEO_FRAMEBUFFER_VRES = vres)
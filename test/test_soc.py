@@ -0,0 +1,316 @@
+#
+# This file is part of LiteX.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+from unittest import mock
+
+from migen import *
+from migen.genlib.io import CRG
+
+from litex.build.sim import SimPlatform
+from litex.build.xilinx import XilinxPlatform
+from litex.soc.interconnect import stream
+from litex.soc.integration.soc_core import SoCCore
+from litex.soc.integration.soc import SoC, SoCRegion, SoCIORegion, SoCBusHandler, SoCIRQHandler
+
+
+class TestSoCBusHandler(unittest.TestCase):
+    def bus_handler(self, io_regions={}):
+        bus = SoCBusHandler()
+        for name, (origin, size) in io_regions.items():
+            bus.add_region(name, SoCIORegion(origin=origin, size=size))
+        return bus
+
+    def assertBusError(self, fn, *args, **kwargs):
+        with self.assertLogs("SoCBusHandler", level="ERROR"):
+            with self.assertRaises(RuntimeError):
+                fn(*args, **kwargs)
+
+    def alloc(self, bus, name, size, cached=True):
+        # Region without origin: allocated by add_region.
+        bus.add_region(name, SoCRegion(size=size, cached=cached))
+        return bus.regions[name]
+
+    def test_alloc_region_first_fit(self):
+        bus = self.bus_handler()
+        bus.add_region("a", SoCRegion(origin=0x0000, size=0x1000))
+        bus.add_region("b", SoCRegion(origin=0x4000, size=0x1000))
+        # Gap between a and b is used when large enough...
+        self.assertEqual(self.alloc(bus, "c", size=0x1000).origin, 0x1000)
+        self.assertEqual(self.alloc(bus, "d", size=0x2000).origin, 0x2000)
+        # ... else Region is allocated after b.
+        self.assertEqual(self.alloc(bus, "e", size=0x2000).origin, 0x6000)
+        self.assertEqual(self.alloc(bus, "f", size=0x1000).origin, 0x5000)
+
+    def test_alloc_region_aligned_on_size(self):
+        bus = self.bus_handler()
+        bus.add_region("a", SoCRegion(origin=0x0000, size=0x1000))
+        # Allocated Regions are aligned on their power of 2 size (0x1800 -> 0x2000).
+        region = self.alloc(bus, "b", size=0x1800)
+        self.assertEqual(region.origin, 0x2000)
+        self.assertEqual(region.size,   0x1800)
+        for origin, size in [(0x3000, 0x100), (0x0000, 0x4000), (0x8000, 0x10000)]:
+            bus = self.bus_handler()
+            bus.add_region("a", SoCRegion(origin=origin, size=size))
+            region = self.alloc(bus, "b", size=0x10000)
+            self.assertEqual(region.origin % 0x10000, 0)
+            self.assertFalse(region.origin < origin + size and origin < region.origin + region.size)
+
+    def test_alloc_region_up_to_search_end(self):
+        bus = self.bus_handler(io_regions={"io": (0x80000000, 0x10000)})
+        bus.add_region("a", SoCRegion(origin=0x80000000, size=0x8000, cached=False))
+        # Region ending exactly at the end of the IO Region.
+        region = self.alloc(bus, "b", size=0x8000, cached=False)
+        self.assertEqual(region.origin, 0x80008000)
+        self.assertEqual(region.origin + region.size, 0x80010000)
+        # IO Region is now full.
+        self.assertBusError(bus.alloc_region, "c", size=0x10, cached=False)
+
+    def test_alloc_region_no_overlap(self):
+        bus = self.bus_handler()
+        for i, size in enumerate([0x100, 0x1800, 0x40, 0x10000, 0x300, 0x2000]):
+            bus.add_region("r{}".format(i), SoCRegion(size=size))
+        regions = sorted(bus.regions.values(), key=lambda r: r.origin)
+        for r0, r1 in zip(regions, regions[1:]):
+            self.assertLessEqual(r0.origin + r0.size_pow2, r1.origin)
+        for r in regions:
+            self.assertEqual(r.origin % r.size_pow2, 0)
+
+    def test_io_region_boundaries(self):
+        bus = self.bus_handler(io_regions={"io": (0x80000000, 0x10000)})
+        # Regions ending exactly at the end of the IO Region are contained.
+        self.assertTrue(bus.check_region_is_io(SoCRegion(origin=0x80000000, size=0x10000)))
+        self.assertTrue(bus.check_region_is_io(SoCRegion(origin=0x8000f000, size=0x1000)))
+        # Regions crossing one of the IO Region boundaries are not.
+        self.assertFalse(bus.check_region_is_io(SoCRegion(origin=0x8000f000, size=0x1001)))
+        self.assertFalse(bus.check_region_is_io(SoCRegion(origin=0x7ffff000, size=0x2000)))
+        self.assertFalse(bus.check_region_is_io(SoCRegion(origin=0x00000000, size=0x1000)))
+        # Non-cached Regions outside of IO Regions are rejected.
+        self.assertBusError(bus.add_region, "a", SoCRegion(origin=0x8000f000, size=0x2000, cached=False))
+        bus.add_region("b", SoCRegion(origin=0x8000f000, size=0x1000, cached=False))
+
+    def test_io_regions_direct_update(self):
+        bus = self.bus_handler(io_regions={"io0": (0x80000000, 0x10000)})
+        self.assertFalse(bus.check_region_is_io(SoCRegion(origin=0x90000000, size=0x1000)))
+        bus.io_regions["io1"] = SoCIORegion(origin=0x90000000, size=0x10000)
+        self.assertTrue(bus.check_region_is_io(SoCRegion(origin=0x90000000, size=0x1000)))
+
+    def test_region_overlap(self):
+        def bus_handler():
+            bus = self.bus_handler(io_regions={"io": (0x80000000, 0x10000)})
+            bus.add_region("a", SoCRegion(origin=0x1000, size=0x1000))
+            return bus
+        # Overlapping Regions are rejected.
+        for origin, size in [(0x1800, 0x1000), (0x0800, 0x1000), (0x0000, 0x4000), (0x1400, 0x100)]:
+            self.assertBusError(bus_handler().add_region, "b", SoCRegion(origin=origin, size=size))
+        # Overlapping IO Regions are rejected.
+        self.assertBusError(bus_handler().add_region, "io1", SoCIORegion(origin=0x8000f000, size=0x2000))
+        # Duplicated names are rejected.
+        self.assertBusError(bus_handler().add_region, "a", SoCRegion(origin=0x4000, size=0x1000))
+        # Adjacent Regions are not overlapping and Linker Regions can overlap other Regions.
+        bus = bus_handler()
+        bus.add_region("b", SoCRegion(origin=0x2000, size=0x1000))
+        bus.add_region("c", SoCRegion(origin=0x0000, size=0x1000))
+        bus.add_region("d", SoCRegion(origin=0x1800, size=0x100, linker=True))
+        bus.add_region("io1", SoCIORegion(origin=0x80010000, size=0x10000))
+
+    def test_check_regions_overlap(self):
+        bus = self.bus_handler()
+        regions = {
+            "a": SoCRegion(origin=0x0000, size=0x1000),
+            "b": SoCRegion(origin=0x2000, size=0x1000),
+            "c": SoCRegion(origin=0x1000, size=0x1000, linker=True),
+        }
+        self.assertIsNone(bus.check_regions_overlap(regions))
+        regions["d"] = SoCRegion(origin=0x2800, size=0x100)
+        self.assertEqual(bus.check_regions_overlap(regions), ("b", "d"))
+        # Linker Regions are only checked when requested.
+        regions["e"] = SoCRegion(origin=0x1800, size=0x100)
+        del regions["d"]
+        self.assertIsNone(bus.check_regions_overlap(regions))
+        self.assertEqual(bus.check_regions_overlap(regions, check_linker=True), ("c", "e"))
+
+    def test_add_region_returns_region(self):
+        bus = self.bus_handler(io_regions={"io": (0x80000000, 0x10000)})
+        region = SoCRegion(origin=0x1000, size=0x1000)
+        self.assertIs(bus.add_region("a", region), region)
+        io_region = SoCIORegion(origin=0x90000000, size=0x1000)
+        self.assertIs(bus.add_region("io1", io_region), io_region)
+        # Allocated Region is returned (and not the origin-less one passed).
+        region = bus.add_region("b", SoCRegion(size=0x100, cached=False))
+        self.assertIs(region, bus.regions["b"])
+        self.assertEqual(region.origin, 0x80000000)
+        self.assertEqual(region.size,   0x100)
+
+    def test_region_str_follows_updates(self):
+        region = SoCRegion(origin=0x1000, size=0x1000)
+        self.assertIn("0x00001000", str(region))
+        region.origin = 0x2000
+        region.mode   = "r"
+        self.assertEqual(str(region), str(SoCRegion(origin=0x2000, size=0x1000, mode="r")))
+
+
+class TestSoCLocHandler(unittest.TestCase):
+    def irq_handler(self, **kwargs):
+        irq = SoCIRQHandler(**kwargs)
+        irq.enable()
+        return irq
+
+    def assertIRQError(self, fn, *args, **kwargs):
+        with self.assertLogs("SoCIRQHandler", level="ERROR"):
+            with self.assertRaises(RuntimeError):
+                fn(*args, **kwargs)
+
+    def test_add_returns_location(self):
+        irq = self.irq_handler()
+        self.assertEqual(irq.add("a", 4), 4)
+        # Allocated Locations: lowest free ones.
+        self.assertEqual(irq.add("b"), 0)
+        self.assertEqual(irq.add("c"), 1)
+        # Existing Location.
+        self.assertEqual(irq.add("a", use_loc_if_exists=True), 4)
+        self.assertEqual(irq.locs, {"a": 4, "b": 0, "c": 1})
+        # Used names/Locations are rejected.
+        self.assertIRQError(irq.add, "a", 5)
+        self.assertIRQError(irq.add, "d", 4)
+
+    def test_bulk_add(self):
+        irq = self.irq_handler()
+        irq.add("a", 2)
+        irq.bulk_add({"b": 0, "c": 5})
+        self.assertEqual(irq.locs, {"a": 2, "b": 0, "c": 5})
+        # Bulk added Locations are tracked as used.
+        self.assertEqual(irq.add("d"), 1)
+        self.assertEqual(irq.add("e"), 3)
+        self.assertIRQError(irq.add, "f", 5)
+
+    def test_bulk_add_allocates_none_locations(self):
+        irq = self.irq_handler()
+        irq.bulk_add({"a": 1, "b": None, "c": 3})
+        self.assertEqual(irq.locs, {"a": 1, "b": 0, "c": 3})
+
+    def test_bulk_add_errors(self):
+        for locs in [
+            {"b": 6, "a": 8}, # Name already used.
+            {"b": 6, "c": 2}, # Location already used.
+            {"b": 6, "c": 6}, # Location used twice in batch.
+            {"b": -1},        # Negative Location.
+            {"b": 64},        # Location higher than maximum.
+            ]:
+            irq = self.irq_handler()
+            irq.add("a", 2)
+            self.assertIRQError(irq.bulk_add, locs)
+
+    def test_bulk_add_irqs_disabled(self):
+        irq = SoCIRQHandler()
+        self.assertIRQError(irq.bulk_add, {"a": 1})
+        self.assertEqual(irq.locs, {})
+        irq.bulk_add({})
+
+    def test_locs_read_only(self):
+        irq = self.irq_handler()
+        irq.add("a", 1)
+        # Locations can only be updated through add/bulk_add.
+        with self.assertRaises(TypeError):
+            irq.locs["b"] = 3
+        with self.assertRaises(TypeError):
+            del irq.locs["a"]
+        self.assertEqual(irq.locs, {"a": 1})
+        self.assertIRQError(irq.add, "c", 1)
+        self.assertEqual(irq.add("d"), 0)
+        self.assertIn("a", str(irq))
+
+
+class TestSoC(unittest.TestCase):
+    def soc(self):
+        return SoC(SimPlatform("SIM", []), sys_clk_freq=int(1e6))
+
+    def assertSoCError(self, fn, *args, **kwargs):
+        with self.assertLogs("SoC", level="ERROR"):
+            with self.assertRaises(RuntimeError):
+                fn(*args, **kwargs)
+
+    def test_check_if_exists(self):
+        soc = self.soc()
+        soc.check_if_exists("dut")
+        soc.submodules.dut = Module()
+        self.assertSoCError(soc.check_if_exists, "dut")
+        # Names shadowing SoC attributes/methods are also rejected.
+        self.assertSoCError(soc.check_if_exists, "add_constant")
+        self.assertSoCError(soc.check_if_exists, "bus")
+        # Names provided by Module.__getattr__ are also rejected.
+        for name in ["comb", "sync", "specials", "submodules", "clock_domains", "finalized", "finalize"]:
+            self.assertSoCError(soc.check_if_exists, name)
+        self.assertSoCError(soc.add_controller, name="sync")
+
+    def test_add_configs(self):
+        soc = self.soc()
+        soc.add_configs(CSR_DATA_WIDTH=32, CPU_TYPE="vexriscv", CPU_HAS_INTERRUPT=None)
+        self.assertEqual(soc.constants["CONFIG_CSR_DATA_WIDTH"], 32)
+        self.assertIsNone(soc.constants["CONFIG_CPU_TYPE_VEXRISCV"])
+        self.assertIsNone(soc.constants["CONFIG_CPU_HAS_INTERRUPT"])
+        # Configs are added in order.
+        self.assertEqual(list(soc.constants)[-3:],
+            ["CONFIG_CSR_DATA_WIDTH", "CONFIG_CPU_TYPE_VEXRISCV", "CONFIG_CPU_HAS_INTERRUPT"])
+        self.assertSoCError(soc.add_configs, CSR_DATA_WIDTH=8)
+
+    def test_add_constants(self):
+        soc = self.soc()
+        soc.add_constants(video_base=0x40c00000, VIDEO_HRES=800, VIDEO_FLAG=None)
+        self.assertEqual(soc.constants["VIDEO_BASE"], 0x40c00000)
+        self.assertEqual(soc.constants["VIDEO_HRES"], 800)
+        self.assertIsNone(soc.constants["VIDEO_FLAG"])
+        # Constants are added in order.
+        self.assertEqual(list(soc.constants)[-3:], ["VIDEO_BASE", "VIDEO_HRES", "VIDEO_FLAG"])
+        self.assertSoCError(soc.add_constants, VIDEO_VRES=600, VIDEO_HRES=640)
+        self.assertEqual(soc.constants["VIDEO_HRES"], 800)
+
+
+try:
+    import litepcie
+except ImportError:
+    litepcie = None
+
+class _PCIePHYModel(Module):
+    def __init__(self, data_width=64):
+        from litepcie.common import get_bar_mask, phy_layout, msi_layout
+        self.data_width       = data_width
+        self.bar0_mask        = get_bar_mask(0x100000)
+        self.id               = Signal(16)
+        self.max_request_size = Signal(10, reset=512)
+        self.max_payload_size = Signal(8,  reset=128)
+        self.sink             = stream.Endpoint(phy_layout(data_width))
+        self.source           = stream.Endpoint(phy_layout(data_width))
+        self.msi              = stream.Endpoint(msi_layout())
+        self.clock_domains.cd_pcie = ClockDomain()
+
+
+@unittest.skipIf(litepcie is None, "LitePCIe (2022.12 or later) not installed")
+class TestSoCPCIe(unittest.TestCase):
+    def soc(self, **kwargs):
+        platform = XilinxPlatform("xc7a35ticsg324-1L", [], toolchain="vivado")
+        soc = SoCCore(platform, clk_freq=int(1e6), cpu_type=None, with_uart=False,
+            integrated_sram_size=0)
+        soc.submodules.crg = CRG(Signal())
+        soc.submodules.pcie_phy = phy = _PCIePHYModel()
+        soc.add_pcie(phy=phy, **kwargs)
+        return soc
+
+    def dma_buffering_depths(self, **kwargs):
+        # Record buffering_depth passed by add_pcie to each LitePCIeDMA.
+        from litepcie.frontend import dma
+        depths = []
+        def LitePCIeDMA(*args, **dma_kwargs):
+            depths.append(dma_kwargs.get("buffering_depth"))
+            return lite_pcie_dma(*args, **dma_kwargs)
+        lite_pcie_dma = dma.LitePCIeDMA
+        with mock.patch.object(dma, "LitePCIeDMA", LitePCIeDMA):
+            soc = self.soc(**kwargs)
+        self.assertEqual(soc.constants["DMA_CHANNELS"], len(depths))
+        return depths
+
+    def test_add_pcie_dma_buffering_depth(self):
+        self.assertEqual(self.dma_buffering_depths(ndmas=1), [1024])
+        self.assertEqual(self.dma_buffering_depths(ndmas=2, dma_buffering_depth=4096), [4096, 4096])
@@ -0,0 +1,54 @@
+#
+# This file is part of LiteX.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+
+from migen import *
+
+from litex.soc.cores.video import VideoTimingGenerator
+
+# Small Video Timings to keep simulations short.
+video_timings = {
+    "pix_clk"       : 1e6,
+    "h_active"      : 8,
+    "h_blanking"    : 6,
+    "h_sync_offset" : 1,
+    "h_sync_width"  : 2,
+    "v_active"      : 4,
+    "v_blanking"    : 3,
+    "v_sync_offset" : 1,
+    "v_sync_width"  : 1,
+}
+
+class TestVideo(unittest.TestCase):
+    def vtg_trace(self, vtg, clock_domain, cycles=256):
+        trace = []
+        fields = ["valid", "first", "last", "de", "hsync", "vsync", "hcount", "vcount"]
+        def generator():
+            yield vtg.source.ready.eq(1)
+            for i in range(cycles):
+                yield
+                values = []
+                for field in fields:
+                    values.append((yield getattr(vtg.source, field)))
+                trace.append(tuple(values))
+        run_simulation(vtg, {clock_domain: generator()}, clocks={clock_domain: 10})
+        return trace
+
+    def test_vtg_clock_domain(self):
+        # VTG built in pix clock domain must behave as a pix renamed VTG.
+        vtg_ref = ClockDomainsRenamer("pix")(VideoTimingGenerator(default_video_timings=video_timings))
+        vtg     = VideoTimingGenerator(default_video_timings=video_timings, clock_domain="pix")
+        trace_ref = self.vtg_trace(vtg_ref, "pix")
+        trace     = self.vtg_trace(vtg,     "pix")
+        self.assertEqual(trace, trace_ref)
+        # Make sure timings were generated (DE/HSync/VSync all toggling).
+        for i in [3, 4, 5]:
+            self.assertEqual({t[i] for t in trace}, {0, 1})
+
+    def test_vtg_default_clock_domain(self):
+        vtg_ref = VideoTimingGenerator(default_video_timings=video_timings)
+        vtg     = VideoTimingGenerator(default_video_timings=video_timings, clock_domain="sys")
+        self.assertEqual(self.vtg_trace(vtg, "sys"), self.vtg_trace(vtg_ref, "sys"))